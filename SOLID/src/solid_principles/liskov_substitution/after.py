@@ -1,6 +1,13 @@
+import atexit
+import logging
 import os
+import threading
 from dataclasses import dataclass, field
-from typing import Optional, Protocol
+from email.mime.text import MIMEText
+from functools import lru_cache, partial
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+from typing import Callable, Optional, Protocol
 
 import stripe
 from dotenv import load_dotenv
@@ -10,6 +17,10 @@ from stripe.error import StripeError
 
 _ = load_dotenv()
 
+stripe.api_key = os.getenv("STRIPE_API_KEY")
+
+logger = logging.getLogger(__name__)
+
 class ContactInfo(BaseModel):
     email: Optional[str] = None
     phone: Optional[str] = None
@@ -25,28 +36,28 @@ class PaymentData(BaseModel):
     source: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CustomerValidator:
     def validate(self, customer_data: CustomerData):
         if not customer_data.name:
-            print("Invalid customer data: missing name")
+            logger.warning("Invalid customer data: missing name")
             raise ValueError("Invalid customer data: missing name")
         if not customer_data.contact_info:
-            print("Invalid customer data: missing contact info")
+            logger.warning("Invalid customer data: missing contact_info")
             raise ValueError("Invalid customer data: missing contact_info")
         if not (customer_data.contact_info.email or customer_data.contact_info.phone):
-            print("Invalid customer data: missing email and phone")
+            logger.warning("Invalid customer data: missing email and phone")
             raise ValueError("Invalid customer data: missing email and phone")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PaymentDataValidator:
     def validate(self, payment_data: PaymentData):
         if not payment_data.source:
-            print("Invalid payment data")
+            logger.warning("Invalid payment data")
             raise ValueError("Invalid payment data")
         if payment_data.amount <= 0:
-            print("Invalid payment data: amount must be greater than 0")
+            logger.warning("Invalid payment data: amount must be greater than 0")
             raise ValueError("Invalid payment data: amount must be greater than 0")
 
 
@@ -58,6 +69,8 @@ class Notifier(Protocol):
     should provide a method `send_confirmation` that sends a confirmation
     to the customer.
     """
+    __slots__ = ()
+
     def send_confirmation(self, customer_data: CustomerData):
         """Send a confirmation notification to the customer.
 
@@ -67,34 +80,59 @@ class Notifier(Protocol):
         raise NotImplemented("Method not implemented")
 
 
+@dataclass(slots=True, frozen=True)
 class EmailNotifier(Notifier):
     def send_confirmation(self, customer_data: CustomerData):
-        from email.mime.text import MIMEText
         msg = MIMEText("Thank you for your payment")
         msg["Subject"] = "Payment Confirmation"
         msg["From"] = "no-reply@example.com"
         msg["To"] = customer_data.contact_info.email or ""
-        
-        print("Email sent to", customer_data.contact_info.email)
+        logger.info("Email sent to %s", customer_data.contact_info.email)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SMSNotifier(Notifier):
     sms_gateway: str
     
     def send_confirmation(self, customer_data: CustomerData):
         phone_number = customer_data.contact_info.phone
-        print(f"send the sms using {self.sms_gateway}: SMS sent to {phone_number}: Thank you for your payment."
+        logger.info(
+            "send the sms using %s: SMS sent to %s: Thank you for your payment.", self.sms_gateway, phone_number
+        )
+
+
+_log_fds: dict[str, int] = {}
+_log_fds_lock = threading.Lock()
+
+
+def _log_fd(path: str) -> int:
+    with _log_fds_lock:
+        fd = _log_fds.get(path)
+        if fd is None:
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            _log_fds[path] = fd
+        return fd
+
+
+def _close_log_fds():
+    with _log_fds_lock:
+        while _log_fds:
+            os.close(_log_fds.popitem()[1])
 
 
-@dataclass
+atexit.register(_close_log_fds)
+
+
+@dataclass(slots=True)
 class TransactionLogger:
     log_file: str = "transactions.log"
-    
+
     def log(self, customer_data: CustomerData, payment_data: PaymentData, charge: Charge):
-        with open(self.log_file, "a") as log_file:
-            log_file.write(f"{customer_data.name} paid {payment_data.amount}\n")
-            log_file.write(f"Payment status: {charge.status}\n")
+        record = f"{customer_data.name} paid {payment_data.amount}\nPayment status: {charge.status}\n"
+        data = record.encode()
+        fd = _log_fd(self.log_file)
+        while data:
+            data = data[os.write(fd, data):]
 
 
 class PaymentProcessor(Protocol):
@@ -105,6 +143,8 @@ class PaymentProcessor(Protocol):
     should provide a method `process_transaction` that takes customer data and payment data,
     and returns a Stripe Charge object.
     """
+    __slots__ = ()
+
     def process_transaction(self, customer_data: CustomerData, payment_data: PaymentData) -> Charge:
         """Process a transaction for the given customer and payment data.
 
@@ -118,10 +158,9 @@ class PaymentProcessor(Protocol):
         raise NotImplemented("Method not implemented")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StripePaymentProcessor(PaymentProcessor):
     def process_transaction(self, customer_data: CustomerData, payment_data: PaymentData) -> Charge:
-        stripe.api_key = os.getenv("STRIPE_API_KEY")
         try:
             charge = stripe.Charge.create(
                 amount=payment_data.amount,
@@ -131,17 +170,17 @@ class StripePaymentProcessor(PaymentProcessor):
             )
             return charge
         except StripeError as e:
-            print(f"Stripe error: {e}")
+            logger.error("Stripe error: %s", e)
             raise ValueError("Payment processing failed")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PaymentService:
-    customer_validator = CustomerValidator()
-    payment_validator = PaymentDataValidator()
+    customer_validator: CustomerValidator = field(default_factory=CustomerValidator)
+    payment_validator: PaymentDataValidator = field(default_factory=PaymentDataValidator)
     payment_processor: PaymentProcessor = field(default_factory=StripePaymentProcessor)
     notifier: Notifier = field(default_factory=EmailNotifier)
-    logger = TransactionLogger()
+    logger: TransactionLogger = field(default_factory=TransactionLogger)
     
     def process_transaction(self, customer_data: CustomerData, payment_data: PaymentData):
         self.customer_validator.validate(customer_data=customer_data)
@@ -156,10 +195,30 @@ class PaymentService:
         return charge
 
 
+NOTIFIER_FACTORIES: dict[str, Callable[[], Notifier]] = {
+    "email": EmailNotifier,
+    "sms": partial(SMSNotifier, sms_gateway="Twilio"),
+}
+
+
+@lru_cache(maxsize=None)
+def get_payment_service(notifier_kind: str = "email") -> PaymentService:
+    try:
+        notifier_factory = NOTIFIER_FACTORIES[notifier_kind]
+    except KeyError:
+        raise ValueError(f"Unknown notifier kind: {notifier_kind}") from None
+    return PaymentService(notifier=notifier_factory())
+
+
 if __name__ == "__main__":
-    sms_notifier = SMSNotifier(sms_gateway="Twilio")
-    payment_service = PaymentService()
-    payment_service_sms_notifier = PaymentService(notifier=sms_notifier)
+    log_queue: Queue = Queue(-1)
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    atexit.register(listener.stop)
+
+    payment_service = get_payment_service()
+    payment_service_sms_notifier = get_payment_service(notifier_kind="sms")
     
     customer_data_with_email = CustomerData(
         name="Alice",
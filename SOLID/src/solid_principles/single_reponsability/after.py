@@ -1,5 +1,13 @@
+import atexit
+import logging
 import os
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
+from email.mime.text import MIMEText
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+from typing import Callable
 
 import stripe
 from dotenv import load_dotenv
@@ -8,54 +16,89 @@ from stripe.error import StripeError
 
 _ = load_dotenv()
 
-@dataclass
+stripe.api_key = os.getenv("STRIPE_API_KEY")
+
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True, frozen=True)
 class CustomerValidator:
     def validate(self, customer_data):
         if not customer_data.get("name"):
-            print("Invalid customer data: missing name")
+            logger.warning("Invalid customer data: missing name")
             raise ValueError("Invalid customer data: missing name")
         if not customer_data.get("contact_info"):
-            print("Invalid customer data: missing contact info")
+            logger.warning("Invalid customer data: missing contact info")
             raise ValueError("Invalid customer data: missing contact info")
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PaymentDataValidator:
     def validate(self, payment_data):
         if not payment_data.get("source"):
-            print("Invalid payment data")
+            logger.warning("Invalid payment data")
             raise ValueError("Invalida payment data")
 
+def _send_email(customer_data):
+    # import smtplib
+    msg = MIMEText("Thank you for your payment")
+    msg["Subject"] = "Payment Confirmation"
+    msg["From"] = "no-reply@example.com"
+    msg["To"] = customer_data["contact_info"]["email"]
+    
+    # server = smtplib.SMTP("localhost")
+    # server.send_message(msg)
+    # server.quit()
+    logger.info("Email sent to %s", customer_data["contact_info"]["email"])
+
+def _send_sms(customer_data):
+    phone_number = customer_data["contact_info"]["phone"]
+    sms_gateway = "the custom SMS Gateway"
+    logger.info("send the sms using %s: SMS sent to %s: Thank you for your payment.", sms_gateway, phone_number)
+
+NOTIFIERS: dict[str, Callable[[dict], None]] = {
+    "email": _send_email,
+    "phone": _send_sms,
+}
+
+@dataclass(slots=True, frozen=True)
 class Notifier:
     def send_confirmation(self, customer_data):
-        if "email" in customer_data["contact_info"]:
-            # import smtplib
-            from email.mime.text import MIMEText
-            
-            msg = MIMEText("Thank you for your payment")
-            msg["Subject"] = "Payment Confirmation"
-            msg["From"] = "no-reply@example.com"
-            msg["To"] = customer_data["contact_info"]["email"]
-            
-            # server = smtplib.SMTP("localhost")
-            # server.send_message(msg)
-            # server.quit()
-            print("Email sent to", customer_data["contact_info"]["email"])
-        elif "phone" in customer_data["contact_info"]:
-            phone_number = customer_data["contact_info"]["phone"]
-            sms_gateway = "the custom SMS Gateway"
-            print(f"send the sms using {sms_gateway}: SMS sent to {phone_number}: Thank you for your payment.")
-
-@dataclass
+        contact_info = customer_data["contact_info"]
+        channel = next((name for name in NOTIFIERS if name in contact_info), None)
+        if channel is not None:
+            NOTIFIERS[channel](customer_data)
+
+_log_fds: dict[str, int] = {}
+_log_fds_lock = threading.Lock()
+
+def _log_fd(path: str) -> int:
+    with _log_fds_lock:
+        fd = _log_fds.get(path)
+        if fd is None:
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            _log_fds[path] = fd
+        return fd
+
+def _close_log_fds():
+    with _log_fds_lock:
+        while _log_fds:
+            os.close(_log_fds.popitem()[1])
+
+atexit.register(_close_log_fds)
+
+@dataclass(slots=True)
 class TrasanctionLogger:
+    log_file: str = "transactions.log"
+
     def log(self, customer_data, payment_data, charge):
-        with open("transactions.log", "a") as log_file:
-            log_file.write(f"{customer_data['name']} paid {payment_data['amount']}\n")
-            log_file.write(f"Payment status: {charge['status']}\n")
+        record = f"{customer_data['name']} paid {payment_data['amount']}\nPayment status: {charge['status']}\n"
+        data = record.encode()
+        fd = _log_fd(self.log_file)
+        while data:
+            data = data[os.write(fd, data):]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StripePaymentProcessor:
     def process_transaction(self, customer_data, payment_data) -> Charge:
-        stripe.api_key = os.getenv("STRIPE_API_KEY")
         try:
             charge = stripe.Charge.create(
                 amount=payment_data["amount"],
@@ -63,19 +106,19 @@ class StripePaymentProcessor:
                 source=payment_data["source"],
                 description="Charge for " + customer_data["name"],
             )
-            print("Payment successful")
+            logger.info("Payment successful")
         except StripeError as e:
-            print("Payment failed:", e)
+            logger.error("Payment failed: %s", e)
             raise e
         return charge
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PaymentService:
-    customer_validator = CustomerValidator()
-    payment_validator = PaymentDataValidator()
-    payment_procesor = StripePaymentProcessor()
-    notifier = Notifier()
-    logger = TrasanctionLogger()
+    customer_validator: CustomerValidator = field(default_factory=CustomerValidator)
+    payment_validator: PaymentDataValidator = field(default_factory=PaymentDataValidator)
+    payment_procesor: StripePaymentProcessor = field(default_factory=StripePaymentProcessor)
+    notifier: Notifier = field(default_factory=Notifier)
+    logger: TrasanctionLogger = field(default_factory=TrasanctionLogger)
     
     def process_transaction(self, customer_data, payment_data) -> Charge:
         try:
@@ -98,8 +141,18 @@ class PaymentService:
         except StripeError as e:
             raise e
 
+@lru_cache(maxsize=1)
+def get_payment_service() -> PaymentService:
+    return PaymentService()
+
 if __name__ == "__main__":
-    payment_procesor = PaymentService()
+    log_queue: Queue = Queue(-1)
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    atexit.register(listener.stop)
+
+    payment_procesor = get_payment_service()
     
     customer_data_with_email = {
         "name": "Jhon Doe",
@@ -112,10 +165,10 @@ if __name__ == "__main__":
     
     payment_data = {"amount": 500, "source": "tok_mastercard", "cvv": 123}
     
-    payment_procesor.process_transaction(customer_data=customer_data_with_email)
+    payment_procesor.process_transaction(customer_data=customer_data_with_email, payment_data=payment_data)
     payment_procesor.process_transaction(customer_data=customer_data_with_phone, payment_data=payment_data)
     
-    payment_data = {"amount": 700, "source", "tok_radarBlock", "cvv": 123}
+    payment_data = {"amount": 700, "source": "tok_radarBlock", "cvv": 123}
     try:
         payment_procesor.process_transaction(customer_data_with_email, payment_data=payment_data)
     except Exception as e:
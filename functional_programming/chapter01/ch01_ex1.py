@@ -31,18 +31,14 @@ def sum_full_oo():
 
 
 def foldr(seq, op, init):
-    if len(seq) == 0:
-        return init
-    return op(seq[0], sum(seq[1:]))
+    acc = init
+    for x in reversed(seq):
+        acc = op(x, acc)
+    return acc
 
 
 def until(n, filter_func, v):
-    if v == n:
-        return []
-    if filter_func(v):
-        return [v] + until(n, filter_func, v + 1)
-    else:
-        return until(n, filter_func, v + 1)
+    return [x for x in range(v, n) if filter_func(x)]
 
 
 def sum_functional():
@@ -55,6 +51,20 @@ def sum_hybrid():
     print(sum(n for n in range(1, 10) if n % 3 == 0 or n % 5 == 0))
 
 
+def sum_closed_form(n=10):
+    """Sum of the multiples of 3 or 5 below n, in constant time.
+
+    >>> sum_closed_form()
+    23
+    >>> sum_closed_form(1000)
+    233168
+    """
+    def series(d):
+        m = (n - 1) // d
+        return d * m * (m + 1) // 2
+    return series(3) + series(5) - series(15)
+
+
 def folding():
     print("foldl:", timeit.timeit("((([]+[1])+[2])+[3])+[4]"))
     print("foldr:", timeit.timeit("[]+([1]+([2]+([3]+[4])))"))
@@ -72,8 +82,18 @@ demo_1 = """
 0
 """
 
+demo_2 = """
+>>> sum_functional()
+23
+>>> foldr([1, 2, 3], lambda x, y: f"({x}+{y})", "0")
+'(1+(2+(3+0)))'
+>>> len(until(10_000, lambda x: x % 2 == 0, 0))
+5000
+"""
+
 __test__ = {
     "demo_1": demo_1,
+    "demo_2": demo_2,
 }
 
 
@@ -1,4 +1,4 @@
-form typing import Callable, Iterator
+from typing import Callable, Iterator
 
 # next_ = lambda n, x: (x+n/x)/2
 
@@ -6,20 +6,27 @@ def next_(n: float, x: float) -> float:
     return (x + n / x) / 2
 
 def repeat(f: Callable[[float], float], a: float)-> Iterator[float]:
-    yield a
-    yield from repeat(f, f(a))
+    while True:
+        yield a
+        a = f(a)
 
 
-def within(f: Callable, iterable: Iterator[float]) -> Iterator[float]:
-    def head_tail(eps: float, a: float, iterable: Iterator[float]):
-        b = next(iterable)
+def within(eps: float, iterable: Iterator[float]) -> float:
+    a = next(iterable)
+    for b in iterable:
         if abs(a - b) < eps:
             return b
-        return head_tail(eps, b, iterable)
-    return head_tail(eps, next(iterable), iterable)
+        a = b
 
 
 def sqrt(a0: float, eps: float, n: float):
+    """Square root of n by Newton-Raphson, starting from a0.
+
+    >>> round(sqrt(1.0, 0.0001, 3), 6)
+    1.732051
+    >>> sqrt(1.0, 1e-6, 1e12)
+    1000000.0
+    """
     return within(eps, repeat(lambda x: next_(n, x), a0))
 
 